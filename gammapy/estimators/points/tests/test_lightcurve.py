@@ -1,6 +1,7 @@
+from copy import deepcopy
 import pytest
 import numpy as np
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_array_equal
 import astropy.units as u
 from astropy.table import Column, Table
 from astropy.time import Time
@@ -84,14 +85,14 @@ def test_lightcurve_properties_time(lc):
     time_delta = axis.time_delta
     assert time_delta.scale == "tai"
     assert time_delta.format == "jd"
-    assert_allclose(time_delta.jd, [2, 7])
+    assert_array_equal(time_delta.jd, [2, 7])
 
 
 def test_lightcurve_properties_flux(lc):
     table = lc.to_table(sed_type="flux", format="lightcurve")
     flux = table["flux"].quantity
     assert flux.unit == "cm-2 s-1"
-    assert_allclose(flux.value, [[1e-11], [3e-11]])
+    assert_array_equal(flux.value, [[1e-11], [3e-11]])
 
 
 # TODO: extend these tests to cover other time scales.
@@ -150,7 +151,8 @@ def test_lightcurve_to_time_series():
     assert_allclose(result.duration, 182.625 * u.d)
 
 
-def get_spectrum_datasets():
+@pytest.fixture(scope="session")
+def spectrum_datasets_simulated():
     model = SkyModel(spectral_model=PowerLawSpectralModel())
     dataset_1 = simulate_spectrum_dataset(model=model, random_state=0)
     dataset_1._name = "dataset_1"
@@ -165,10 +167,16 @@ def get_spectrum_datasets():
     return [dataset_1, dataset_2]
 
 
+@pytest.fixture()
+def spectrum_datasets(spectrum_datasets_simulated):
+    # the estimators modify the datasets in place
+    return deepcopy(spectrum_datasets_simulated)
+
+
 @requires_data()
-def test_group_datasets_in_time_interval():
+def test_group_datasets_in_time_interval(spectrum_datasets):
     # Doing a LC on one hour bin
-    datasets = Datasets(get_spectrum_datasets())
+    datasets = Datasets(spectrum_datasets)
     time_intervals = [
         Time(["2010-01-01T00:00:00", "2010-01-01T01:00:00"]),
         Time(["2010-01-01T01:00:00", "2010-01-01T02:00:00"]),
@@ -179,12 +187,12 @@ def test_group_datasets_in_time_interval():
     assert len(group_table) == 2
     assert_allclose(group_table["time_min"], [55197.0, 55197.04166666667])
     assert_allclose(group_table["time_max"], [55197.04166666667, 55197.083333333336])
-    assert_allclose(group_table["group_idx"], [0, 1])
+    assert_array_equal(group_table["group_idx"], [0, 1])
 
 
 @requires_data()
-def test_group_datasets_in_time_interval_outflows():
-    datasets = Datasets(get_spectrum_datasets())
+def test_group_datasets_in_time_interval_outflows(spectrum_datasets):
+    datasets = Datasets(spectrum_datasets)
     # Check Overflow
     time_intervals = [
         Time(["2010-01-01T00:00:00", "2010-01-01T00:55:00"]),
@@ -204,9 +212,9 @@ def test_group_datasets_in_time_interval_outflows():
 
 
 @requires_data()
-def test_lightcurve_estimator_fit_options():
+def test_lightcurve_estimator_fit_options(spectrum_datasets):
     # Doing a LC on one hour bin
-    datasets = get_spectrum_datasets()
+    datasets = spectrum_datasets
     time_intervals = [
         Time(["2010-01-01T00:00:00", "2010-01-01T01:00:00"]),
         Time(["2010-01-01T01:00:00", "2010-01-01T02:00:00"]),
@@ -221,16 +229,16 @@ def test_lightcurve_estimator_fit_options():
         fit=Fit(backend="minuit", optimize_opts=dict(tol=0.2, strategy=1)),
     )
 
-    assert_allclose(estimator.fit.optimize_opts["tol"], 0.2)
+    assert_array_equal(estimator.fit.optimize_opts["tol"], 0.2)
 
     result = estimator.fit.run(datasets=datasets)
-    assert_allclose(result.minuit.tol, 0.2)
+    assert_array_equal(result.minuit.tol, 0.2)
 
 
 @requires_data()
-def test_lightcurve_estimator_spectrum_datasets():
+def test_lightcurve_estimator_spectrum_datasets(spectrum_datasets):
     # Doing a LC on one hour bin
-    datasets = get_spectrum_datasets()
+    datasets = spectrum_datasets
     time_intervals = [
         Time(["2010-01-01T00:00:00", "2010-01-01T01:00:00"]).tt,
         Time(["2010-01-01T01:00:00", "2010-01-01T02:00:00"]).tt,
@@ -248,7 +256,7 @@ def test_lightcurve_estimator_spectrum_datasets():
     assert_allclose(table["time_min"], [55197.0, 55197.041667])
     assert_allclose(table["time_max"], [55197.041667, 55197.083333])
     assert_allclose(table["e_ref"], [[5.623413], [5.623413]])
-    assert_allclose(table["e_min"], [[1], [1]])
+    assert_array_equal(table["e_min"], [[1], [1]])
     assert_allclose(table["e_max"], [[31.622777], [31.622777]])
     assert_allclose(table["ref_dnde"], [[3.162278e-14], [3.162278e-14]], rtol=1e-5)
     assert_allclose(table["ref_flux"], [[9.683772e-13], [9.683772e-13]], rtol=1e-5)
@@ -256,7 +264,7 @@ def test_lightcurve_estimator_spectrum_datasets():
     assert_allclose(table["stat"], [[16.824042], [17.391981]], rtol=1e-5)
     assert_allclose(table["norm"], [[0.911963], [0.9069318]], rtol=1e-2)
     assert_allclose(table["norm_err"], [[0.057769], [0.057835]], rtol=1e-2)
-    assert_allclose(table["counts"], [[[791, np.nan]], [[np.nan, 784]]])
+    assert_array_equal(table["counts"], [[[791, np.nan]], [[np.nan, 784]]])
     assert_allclose(table["norm_errp"], [[0.058398], [0.058416]], rtol=1e-2)
     assert_allclose(table["norm_errn"], [[0.057144], [0.057259]], rtol=1e-2)
     assert_allclose(table["norm_ul"], [[1.029989], [1.025061]], rtol=1e-2)
@@ -289,9 +297,9 @@ def test_lightcurve_estimator_spectrum_datasets():
 
 
 @requires_data()
-def test_lightcurve_estimator_spectrum_datasets_2_energy_bins():
+def test_lightcurve_estimator_spectrum_datasets_2_energy_bins(spectrum_datasets):
     # Doing a LC on one hour bin
-    datasets = get_spectrum_datasets()
+    datasets = spectrum_datasets
     time_intervals = [
         Time(["2010-01-01T00:00:00", "2010-01-01T01:00:00"]),
         Time(["2010-01-01T01:00:00", "2010-01-01T02:00:00"]),
@@ -407,9 +415,9 @@ def test_lightcurve_estimator_spectrum_datasets_2_energy_bins():
 
 
 @requires_data()
-def test_lightcurve_estimator_spectrum_datasets_with_mask_fit():
+def test_lightcurve_estimator_spectrum_datasets_with_mask_fit(spectrum_datasets):
     # Doing a LC on one hour bin
-    datasets = get_spectrum_datasets()
+    datasets = spectrum_datasets
     time_intervals = [
         Time(["2010-01-01T00:00:00", "2010-01-01T01:00:00"]),
         Time(["2010-01-01T01:00:00", "2010-01-01T02:00:00"]),
@@ -439,10 +447,10 @@ def test_lightcurve_estimator_spectrum_datasets_with_mask_fit():
 
 
 @requires_data()
-def test_lightcurve_estimator_spectrum_datasets_default():
+def test_lightcurve_estimator_spectrum_datasets_default(spectrum_datasets):
     # Test default time interval: each time interval is equal to the gti of each
     # dataset, here one hour
-    datasets = get_spectrum_datasets()
+    datasets = spectrum_datasets
     selection = ["scan"]
     estimator = LightCurveEstimator(
         energy_edges=[1, 30] * u.TeV, norm_n_values=3, selection_optional=selection
@@ -455,10 +463,10 @@ def test_lightcurve_estimator_spectrum_datasets_default():
 
 
 @requires_data()
-def test_lightcurve_estimator_spectrum_datasets_notordered():
+def test_lightcurve_estimator_spectrum_datasets_notordered(spectrum_datasets):
     # Test that if the time intervals given are not ordered in time, it is first ordered
     # correctly and then compute as expected
-    datasets = get_spectrum_datasets()
+    datasets = spectrum_datasets
     time_intervals = [
         Time(["2010-01-01T01:00:00", "2010-01-01T02:00:00"]),
         Time(["2010-01-01T00:00:00", "2010-01-01T01:00:00"]),
@@ -477,9 +485,9 @@ def test_lightcurve_estimator_spectrum_datasets_notordered():
 
 
 @requires_data()
-def test_lightcurve_estimator_spectrum_datasets_largerbin():
+def test_lightcurve_estimator_spectrum_datasets_largerbin(spectrum_datasets):
     # Test all dataset in a single LC bin, here two hours
-    datasets = get_spectrum_datasets()
+    datasets = spectrum_datasets
     time_intervals = [Time(["2010-01-01T00:00:00", "2010-01-01T02:00:00"])]
     estimator = LightCurveEstimator(
         energy_edges=[1, 30] * u.TeV,
@@ -493,7 +501,7 @@ def test_lightcurve_estimator_spectrum_datasets_largerbin():
     assert_allclose(table["time_min"], [55197.0])
     assert_allclose(table["time_max"], [55197.083333])
     assert_allclose(table["e_ref"][0], [5.623413])
-    assert_allclose(table["e_min"][0], [1])
+    assert_array_equal(table["e_min"][0], [1])
     assert_allclose(table["e_max"][0], [31.622777])
     assert_allclose(table["ref_dnde"][0], [3.162278e-14], rtol=1e-5)
     assert_allclose(table["ref_flux"][0], [9.683772e-13], rtol=1e-5)
@@ -505,9 +513,9 @@ def test_lightcurve_estimator_spectrum_datasets_largerbin():
 
 
 @requires_data()
-def test_lightcurve_estimator_spectrum_datasets_emptybin():
+def test_lightcurve_estimator_spectrum_datasets_emptybin(spectrum_datasets):
     # Test all dataset in a single LC bin, here two hours
-    datasets = get_spectrum_datasets()
+    datasets = spectrum_datasets
     time_intervals = [
         Time(["2010-01-01T00:00:00", "2010-01-01T02:00:00"]),
         Time(["2010-02-01T00:00:00", "2010-02-01T02:00:00"]),
@@ -526,9 +534,9 @@ def test_lightcurve_estimator_spectrum_datasets_emptybin():
 
 
 @requires_data()
-def test_lightcurve_estimator_spectrum_datasets_timeoverlaped():
+def test_lightcurve_estimator_spectrum_datasets_timeoverlaped(spectrum_datasets):
     # Check that it returns a ValueError if the time intervals overlapped
-    datasets = get_spectrum_datasets()
+    datasets = spectrum_datasets
     time_intervals = [
         Time(["2010-01-01T00:00:00", "2010-01-01T01:30:00"]),
         Time(["2010-01-01T01:00:00", "2010-01-01T02:00:00"]),
@@ -542,9 +550,11 @@ def test_lightcurve_estimator_spectrum_datasets_timeoverlaped():
 
 
 @requires_data()
-def test_lightcurve_estimator_spectrum_datasets_gti_not_include_in_time_intervals():
+def test_lightcurve_estimator_spectrum_datasets_gti_not_include_in_time_intervals(
+    spectrum_datasets,
+):
     # Check that it returns a ValueError if the time intervals are smaller than the dataset GTI.
-    datasets = get_spectrum_datasets()
+    datasets = spectrum_datasets
     time_intervals = [
         Time(["2010-01-01T00:00:00", "2010-01-01T00:05:00"]),
         Time(["2010-01-01T01:00:00", "2010-01-01T01:05:00"]),
@@ -561,7 +571,8 @@ def test_lightcurve_estimator_spectrum_datasets_gti_not_include_in_time_interval
     assert str(excinfo.value) == msg
 
 
-def get_map_datasets():
+@pytest.fixture(scope="session")
+def map_datasets_simulated():
     dataset_1 = simulate_map_dataset(random_state=0, name="dataset_1")
     gti1 = GTI.create("0 h", "1 h", "2010-01-01T00:00:00")
     dataset_1.gti = gti1
@@ -581,8 +592,8 @@ def get_map_datasets():
 
 
 @requires_data()
-def test_lightcurve_estimator_map_datasets():
-    datasets = get_map_datasets()
+def test_lightcurve_estimator_map_datasets(map_datasets_simulated):
+    datasets = deepcopy(map_datasets_simulated)
 
     time_intervals = [
         Time(["2010-01-01T00:00:00", "2010-01-01T01:00:00"]),
@@ -610,7 +621,7 @@ def test_lightcurve_estimator_map_datasets():
     assert_allclose(table["sqrt_ts"], [[35.880361], [35.636547]], rtol=1e-2)
     assert_allclose(table["ts"], [[1287.4003], [1269.963491]], rtol=1e-2)
 
-    datasets = get_map_datasets()
+    datasets = deepcopy(map_datasets_simulated)
 
     time_intervals2 = [Time(["2010-01-01T00:00:00", "2010-01-01T02:00:00"])]
     estimator2 = LightCurveEstimator(
@@ -632,13 +643,13 @@ def test_lightcurve_estimator_map_datasets():
     assert_allclose(table["stat"][0], [18920.54651], rtol=1e-2)
     assert_allclose(table["norm"][0], [0.967438], rtol=1e-2)
     assert_allclose(table["norm_err"][0], [0.031508], rtol=1e-2)
-    assert_allclose(table["counts"][0], [[2205, 2220]])
+    assert_array_equal(table["counts"][0], [[2205, 2220]])
     assert_allclose(table["ts"][0], [2557.346464], rtol=1e-2)
 
 
 @requires_data()
-def test_recompute_ul():
-    datasets = get_spectrum_datasets()
+def test_recompute_ul(spectrum_datasets):
+    datasets = spectrum_datasets
     selection = ["all"]
     estimator = LightCurveEstimator(
         energy_edges=[1, 3, 30] * u.TeV, selection_optional=selection, n_sigma_ul=2
@@ -665,8 +676,8 @@ def test_recompute_ul():
 
 
 @requires_data()
-def test_lightcurve_parallel():
-    datasets = get_spectrum_datasets()
+def test_lightcurve_parallel(spectrum_datasets):
+    datasets = spectrum_datasets
     selection = ["all"]
     estimator = LightCurveEstimator(
         energy_edges=[1, 3, 30] * u.TeV,
@@ -69,7 +69,10 @@ class PSF(IRF):
         rad = np.expand_dims(rad, axis=axis).T
         containment = self.containment(rad=rad, **kwargs)
 
-        fraction_idx = np.argmin(np.abs(containment - fraction), axis=0)
+        # the distance to the fraction re-uses a single temporary array
+        distance = np.subtract(containment.value, fraction)
+        np.abs(distance, out=distance)
+        fraction_idx = np.argmin(distance, axis=0)
         return rad[fraction_idx].reshape(output.shape)
 
     def info(
@@ -1,7 +1,12 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+from functools import lru_cache
 import numpy as np
+import scipy.ndimage
 import astropy.units as u
+from astropy.coordinates import SkyCoord
+from astropy.io.fits import Header
 from astropy.visualization import quantity_support
+from astropy.wcs import WCS
 import matplotlib.pyplot as plt
 from matplotlib.ticker import FormatStrFormatter
 from gammapy.maps import Map, MapAxes, MapAxis, MapCoord, WcsGeom
@@ -16,6 +21,104 @@ from .kernel import PSFKernel
 __all__ = ["PSFMap", "RecoPSFMap"]
 
 
+def _get_pixel_quadrature_separation(geom, order):
+    """Separation of the pixel quadrature nodes to the image center.
+
+    The nodes and weights of a Gauss-Legendre quadrature of the given order
+    are used along both pixel axes. The result only depends on the image
+    WCS, so it is cached for repeated calls with equivalent geometries.
+    The separation is stored in single precision to limit the memory held
+    by the cache, which is sufficient for the lookup on the rad axis.
+
+    Parameters
+    ----------
+    geom : `~gammapy.maps.WcsGeom`
+        Map geometry.
+    order : int
+        Number of quadrature nodes per pixel axis.
+
+    Returns
+    -------
+    separation : `~astropy.coordinates.Angle`
+        Separation with shape (order ** 2, ny, nx) and dtype float32.
+    weights : `~numpy.ndarray`
+        Quadrature weights with shape (order ** 2,). The weights sum up to one.
+    """
+    geom_image = geom.to_image()
+    ny, nx = geom_image.data_shape
+    return _get_pixel_quadrature_separation_cached(
+        wcs_header=geom_image.wcs.to_header_string(), npix=(nx, ny), order=order
+    )
+
+
+@lru_cache(maxsize=8)
+def _get_pixel_quadrature_separation_cached(wcs_header, npix, order):
+    nodes, weights = np.polynomial.legendre.leggauss(order)
+
+    # map nodes from [-1, 1] to [-0.5, 0.5] pixels
+    offset_x, offset_y = np.meshgrid(nodes / 2, nodes / 2)
+    weights = np.outer(weights / 2, weights / 2).ravel()
+
+    geom = WcsGeom(wcs=WCS(Header.fromstring(wcs_header)), npix=npix)
+    idx_x, idx_y = geom.get_idx()
+
+    pix = (
+        idx_x + offset_x.reshape((-1, 1, 1)),
+        idx_y + offset_y.reshape((-1, 1, 1)),
+    )
+    lon, lat = geom.pix_to_coord(pix)
+    skycoord = SkyCoord(lon, lat, frame=geom.frame)
+    separation = skycoord.separation(geom.center_skydir).astype(np.float32)
+
+    # the cached arrays are shared between calls
+    separation.flags.writeable = False
+    weights.flags.writeable = False
+    return separation, weights
+
+
+def _offset_by(lon, lat, position_angle, separation):
+    """Offset positions on the sphere by a given position angle and separation.
+
+    Equivalent to `~astropy.coordinates.SkyCoord.directional_offset_by`, but
+    working on plain arrays.
+
+    Parameters
+    ----------
+    lon, lat : `~numpy.ndarray`
+        Longitude and latitude of the starting points in degrees.
+    position_angle, separation : `~numpy.ndarray`
+        Position angle and separation of the offset in degrees.
+
+    Returns
+    -------
+    lon, lat : `~numpy.ndarray`
+        Longitude in the range [0, 360) and latitude of the offset positions
+        in degrees.
+    """
+    lon, lat = np.deg2rad(lon), np.deg2rad(lat)
+    position_angle, separation = np.deg2rad(position_angle), np.deg2rad(separation)
+
+    sin_lat, cos_lat = np.sin(lat), np.cos(lat)
+    sin_sep, cos_sep = np.sin(separation), np.cos(separation)
+
+    # spherical cosine rule for the latitude, sine and cosine rule for the
+    # change in longitude, as in `~astropy.coordinates.offset_by`
+    sin_lat_new = sin_lat * cos_sep + cos_lat * sin_sep * np.cos(position_angle)
+    dlon = np.arctan2(
+        sin_sep * np.sin(position_angle) * cos_lat, cos_sep - sin_lat_new * sin_lat
+    )
+
+    # at the poles the change in longitude is undefined, the points are treated
+    # as infinitesimally close to the pole at the given longitude
+    dlon = np.where(
+        cos_lat < 1e-12, np.pi / 2 + sin_lat * (np.pi / 2 - position_angle), dlon
+    )
+
+    lon_new = np.mod(np.rad2deg(lon + dlon), 360)
+    lat_new = np.rad2deg(np.arcsin(sin_lat_new))
+    return lon_new, lat_new
+
+
 class IRFLikePSF(PSF):
     required_axes = ["energy_true", "rad", "lat_idx", "lon_idx"]
     tag = "irf_like_psf"
@@ -73,6 +176,7 @@ class PSFMap(IRFMap):
 
     def __init__(self, psf_map, exposure_map=None):
         super().__init__(irf_map=psf_map, exposure_map=exposure_map)
+        self._psf_irf_cached = None
 
     @property
     def energy_name(self):
@@ -85,6 +189,7 @@ class PSFMap(IRFMap):
     @psf_map.setter
     def psf_map(self, value):
         self._irf_map = value
+        self._psf_irf_cached = None
 
     def normalize(self):
         """Normalize PSF map"""
@@ -112,6 +217,37 @@ class PSFMap(IRFMap):
     # TODO: this is a workaround for now, probably add Map.integral() or similar
     @property
     def _psf_irf(self):
+        psf = self._psf_irf_cached
+
+        # the map data array is replaced e.g. on stacking or normalisation
+        if psf is None or psf.data is not self.psf_map.data:
+            psf = self._create_psf_irf()
+            self._psf_irf_cached = psf
+
+        return psf
+
+    def _get_psf_data_interp(self):
+        """PSF data with axis order (lat, lon, energy, rad) used for interpolation.
+
+        Storing the PSF profiles contiguously in memory makes the reads along
+        the rad and energy axes local. The data is converted to float64 and
+        padded by one node on each side of every axis with linearly
+        extrapolated values.
+
+        The array is not cached, because the PSF map data can be modified
+        in place. This creates a copy of the PSF cube, which is small compared
+        to the evaluated kernels.
+        """
+        values = np.moveaxis(self.psf_map.data, (0, 1), (2, 3))
+        values = values.astype(np.float64, copy=False)
+        is_finite = np.isfinite(values)
+
+        if np.any(is_finite) and not np.all(is_finite):
+            values = np.where(is_finite, values, 0.0)
+
+        return np.pad(values, pad_width=1, mode="reflect", reflect_type="odd")
+
+    def _create_psf_irf(self):
         geom = self.psf_map.geom
         npix_x, npix_y = geom.npix
         axis_lon = MapAxis.from_edges(np.arange(npix_x + 1) - 0.5, name="lon_idx")
@@ -146,6 +282,46 @@ class PSFMap(IRFMap):
 
         return coords_irf
 
+    def _interp_by_coord(self, coords):
+        """Interpolate PSF map values at the given coords.
+
+        For regular WCS geometries the values are interpolated linearly in pixel
+        coordinates using `~scipy.ndimage.map_coordinates`. Values up to one
+        node outside of the map are extrapolated linearly. The generic
+        `~gammapy.maps.Map.interp_by_coord` is used as a fallback, e.g. when
+        extrapolation further outside of the map is required.
+
+        Parameters
+        ----------
+        coords : dict
+            Coordinates passed to `~gammapy.maps.Map.interp_by_coord`.
+
+        Returns
+        -------
+        values : `~numpy.ndarray`
+            Interpolated PSF values.
+        """
+        geom = self.psf_map.geom
+
+        if not (isinstance(geom, WcsGeom) and geom.is_regular):
+            return self.psf_map.interp_by_coord(coords)
+
+        pix = np.broadcast_arrays(*geom.coord_to_pix(coords))
+
+        for idx, npix in zip(pix, self.psf_map.data.shape[::-1]):
+            if npix > 1 and not np.all((idx >= -1) & (idx <= npix)):
+                return self.psf_map.interp_by_pix(pix)
+
+        # the interpolation data is padded by one node on each side
+        lon_pix, lat_pix, rad_pix, energy_pix = [idx + 1 for idx in pix]
+        return scipy.ndimage.map_coordinates(
+            self._get_psf_data_interp(),
+            [lat_pix, lon_pix, energy_pix, rad_pix],
+            order=1,
+            mode="nearest",
+            prefilter=False,
+        )
+
     def containment(self, rad, energy_true, position=None):
         """Containment at given coords
 
@@ -212,15 +388,26 @@ class PSFMap(IRFMap):
         """
         geom = self.psf_map.geom.to_image()
 
-        data = self.containment_radius(
-            fraction,
-            energy_true,
-            geom.get_coord().skycoord,
-        )
+        # the pixel indices of the map are the spatial coordinates of the
+        # IRF-like PSF, so the conversion from and to sky coordinates is skipped
+        lon_idx, lat_idx = geom.get_idx()
+        coords = {
+            "lon_idx": lon_idx,
+            "lat_idx": lat_idx,
+            self.energy_name: energy_true,
+        }
+
+        data = self._psf_irf.containment_radius(fraction, **coords)
         return Map.from_geom(geom=geom, data=data.value, unit=data.unit)
 
     def get_psf_kernel(
-        self, geom, position=None, max_radius=None, containment=0.999, factor=4
+        self,
+        geom,
+        position=None,
+        max_radius=None,
+        containment=0.999,
+        factor=4,
+        dtype="float64",
     ):
         """Returns a PSF kernel at the given position.
 
@@ -240,48 +427,123 @@ class PSFMap(IRFMap):
             across all energies is used. The radius can be overwritten using
             the `max_radius` argument.
         factor : int
-            oversampling factor to compute the PSF
+            Number of Gauss-Legendre quadrature nodes per pixel and axis used
+            to integrate the PSF over the kernel pixels.
+        dtype : str
+            Data type used to evaluate the kernels on the pixel quadrature
+            nodes and of the returned kernel maps. Using "float32" halves the
+            memory traffic at the cost of single precision. Default is "float64".
 
         Returns
         -------
         kernel : `~gammapy.irf.PSFKernel`
             the resulting kernel
         """
-        # TODO: try to simplify...is the oversampling needed?
         if position is None:
             position = self.psf_map.geom.center_skydir
 
-        position = self._get_nearest_valid_position(position)
+        kernels = self.get_psf_kernels(
+            geom=geom,
+            positions=position.reshape((1,)),
+            max_radius=max_radius,
+            containment=containment,
+            factor=factor,
+            dtype=dtype,
+        )
+        return kernels[0]
+
+    def get_psf_kernels(
+        self,
+        geom,
+        positions,
+        max_radius=None,
+        containment=0.999,
+        factor=4,
+        dtype="float64",
+    ):
+        """Returns PSF kernels at the given positions.
+
+        The PSF profiles are interpolated for all positions at once. All
+        kernels share the same geometry.
+
+        Parameters
+        ----------
+        geom : `~gammapy.maps.Geom`
+            Target geometry to use
+        positions : `~astropy.coordinates.SkyCoord`
+            Target positions. Should be a 1D array of coordinates.
+        max_radius : `~astropy.coordinates.Angle`
+            maximum angular size of the kernel maps
+        containment : float
+            Containment fraction to use as size of the kernels. The max. radius
+            across all energies and positions is used. The radius can be
+            overwritten using the `max_radius` argument.
+        factor : int
+            Number of Gauss-Legendre quadrature nodes per pixel and axis used
+            to integrate the PSF over the kernel pixels.
+        dtype : str
+            Data type used to evaluate the kernels on the pixel quadrature
+            nodes and of the returned kernel maps. Using "float32" halves the
+            memory traffic at the cost of single precision. Default is "float64".
+
+        Returns
+        -------
+        kernels : list of `~gammapy.irf.PSFKernel`
+            the resulting kernels, one per position
+        """
+        frame = positions.frame.replicate_without_data()
+        positions = SkyCoord(
+            [
+                self._get_nearest_valid_position(position).transform_to(frame)
+                for position in positions
+            ]
+        )
 
         if max_radius is None:
             energy_axis = self.psf_map.geom.axes[self.energy_name]
             kwargs = {
                 "fraction": containment,
-                "position": position,
-                self.energy_name: energy_axis.center,
+                "position": positions,
+                self.energy_name: energy_axis.center[:, np.newaxis],
             }
             radii = self.containment_radius(**kwargs)
             max_radius = np.max(radii)
 
         geom = geom.to_odd_npix(max_radius=max_radius)
-        geom_upsampled = geom.upsample(factor=factor)
-        coords = geom_upsampled.get_coord(sparse=True)
-        rad = coords.skycoord.separation(geom.center_skydir)
+        rad, weights = _get_pixel_quadrature_separation(geom=geom, order=factor)
+
+        # the PSF only depends on energy and rad, so the profiles are interpolated
+        # on the rad axis nodes first and then evaluated on the rad images
+        rad_axis = self.psf_map.geom.axes["rad"]
+        energy = geom.axes[self.energy_name].center
 
         coords = {
-            self.energy_name: coords[self.energy_name],
-            "rad": rad,
-            "skycoord": position,
+            self.energy_name: energy[:, np.newaxis, np.newaxis],
+            "rad": rad_axis.center,
+            "skycoord": positions.reshape((-1, 1)),
         }
 
-        data = self.psf_map.interp_by_coord(
-            coords=coords,
-            method="linear",
-        )
+        profiles = self._interp_by_coord(coords=coords).astype(dtype, copy=False)
 
-        kernel_map = Map.from_geom(geom=geom_upsampled, data=np.clip(data, 0, np.inf))
-        kernel_map = kernel_map.downsample(factor, preserve_counts=True)
-        return PSFKernel(kernel_map, normalize=True)
+        # linear interpolation along the rad axis, values outside of the axis
+        # are extrapolated
+        rad_pix = rad_axis.coord_to_pix(rad)
+        idx = np.clip(np.floor(rad_pix).astype(int), 0, rad_axis.nbin - 2)
+        weights_upper = (rad_pix - idx).astype(dtype, copy=False)
+        weights = weights.astype(dtype, copy=False)
+
+        kernels = []
+
+        for profile in np.moveaxis(profiles, 1, 0):
+            values = profile[:, idx] * (1 - weights_upper)
+            values += profile[:, idx + 1] * weights_upper
+            np.clip(values, 0, np.inf, out=values)
+            data = np.tensordot(values, weights, axes=(1, 0))
+
+            kernel_map = Map.from_geom(geom=geom, data=data)
+            kernels.append(PSFKernel(kernel_map, normalize=True))
+
+        return kernels
 
     def sample_coord(self, map_coord, random_state=0):
         """Apply PSF corrections on the coordinates of a set of simulated events.
@@ -310,22 +572,32 @@ class PSFMap(IRFMap):
         }
 
         pdf = (
-            self.psf_map.interp_by_coord(coord)
+            self._interp_by_coord(coord)
             * rad_axis.center.value
             * rad_axis.bin_width.value
         )
 
-        sample_pdf = InverseCDFSampler(pdf, axis=1, random_state=random_state)
-        pix_coord = sample_pdf.sample_axis()
-        separation = rad_axis.pix_to_coord(pix_coord)
-
-        position_angle = random_state.uniform(360, size=len(map_coord.lon)) * u.deg
+        # draw the CDF choices and the position angles in a single call. The
+        # second row intentionally reproduces the previous uniform(360) call,
+        # i.e. low=360 and high=1, so angles fall in (1, 360]. Do not change it
+        # to high=360, this would change the results for a given random seed.
+        choices, position_angle = random_state.uniform(
+            low=[[0], [360]], high=1, size=(2, len(map_coord.lon))
+        )
 
-        event_positions = map_coord.skycoord.directional_offset_by(
-            position_angle=position_angle, separation=separation
+        sample_pdf = InverseCDFSampler(pdf, axis=1, random_state=random_state)
+        pix_coord = sample_pdf.sample_axis(choices=choices)
+        separation = rad_axis.pix_to_coord(pix_coord).to_value("deg")
+
+        lon, lat = _offset_by(
+            lon=u.Quantity(map_coord.lon, "deg").value.ravel(),
+            lat=u.Quantity(map_coord.lat, "deg").value.ravel(),
+            position_angle=position_angle,
+            separation=separation,
         )
         return MapCoord.create(
-            {"skycoord": event_positions, self.energy_name: map_coord[self.energy_name]}
+            {"lon": lon, "lat": lat, self.energy_name: map_coord[self.energy_name]},
+            frame=map_coord.frame,
         )
 
     @classmethod
@@ -370,12 +642,18 @@ class PSFMap(IRFMap):
 
         coords = geom.get_coord(sparse=True)
 
-        sigma = u.Quantity(sigma).reshape((-1, 1, 1, 1))
+        sigma = u.Quantity(sigma)
+
+        if not sigma.isscalar:
+            sigma = sigma.reshape((-1, 1, 1, 1))
+
         gauss = Gauss2DPDF(sigma=sigma)
 
-        data = gauss(coords["rad"]) * np.ones(geom.data_shape)
+        # evaluate the profile only and broadcast it to the spatial axes
+        values = gauss(coords["rad"]).to_value("sr-1")
+        data = np.broadcast_to(values, geom.data_shape).copy()
 
-        psf_map = Map.from_geom(geom=geom, data=data.to_value("sr-1"), unit="sr-1")
+        psf_map = Map.from_geom(geom=geom, data=data, unit="sr-1")
 
         exposure_map = Map.from_geom(
             geom=geom.squash(axis_name="rad"), unit="m2 s", data=1.0
@@ -411,7 +689,8 @@ class PSFMap(IRFMap):
             axes_names=[self.energy_name], keepdims=keepdims
         )
 
-        psf_data = exp_weighed.data * self.psf_map.data / exposure.data
+        psf_data = exp_weighed.data * self.psf_map.data
+        psf_data /= exposure.data
         psf_map = Map.from_geom(geom=self.psf_map.geom, data=psf_data, unit="sr-1")
 
         psf = psf_map.sum_over_axes(axes_names=[self.energy_name], keepdims=keepdims)
@@ -485,7 +764,7 @@ class PSFMap(IRFMap):
         rad = self.psf_map.geom.axes["rad"].center
 
         for value in energy_true:
-            psf_value = self.psf_map.interp_by_coord(
+            psf_value = self._interp_by_coord(
                 {
                     "skycoord": self.psf_map.geom.center_skydir,
                     self.energy_name: value,
@@ -7,6 +7,7 @@ from astropy.coordinates import SkyCoord
 from astropy.units import Unit
 from gammapy.data import DataStore
 from gammapy.irf import PSF3D, EffectiveAreaTable2D, PSFMap, RecoPSFMap
+from gammapy.irf.psf.map import _offset_by
 from gammapy.makers.utils import make_map_exposure_true_energy, make_psf_map
 from gammapy.maps import Map, MapAxis, MapCoord, RegionGeom, WcsGeom
 from gammapy.utils.testing import mpl_plot_check, requires_data
@@ -124,6 +125,19 @@ def test_psf_map_containment_radius():
     )
 
 
+def test_psf_map_containment_radius_update():
+    psf_map = make_test_psfmap(0.15 * u.deg)
+    radius = psf_map.containment_radius(energy_true=1 * u.TeV, fraction=0.5)
+
+    psf_map.psf_map = make_test_psfmap(0.3 * u.deg).psf_map
+    radius_update = psf_map.containment_radius(energy_true=1 * u.TeV, fraction=0.5)
+    assert_allclose(radius_update, 2 * radius, rtol=1e-2)
+
+    psf_map.psf_map.data = make_test_psfmap(0.15 * u.deg).psf_map.data
+    radius_update = psf_map.containment_radius(energy_true=1 * u.TeV, fraction=0.5)
+    assert_allclose(radius_update, radius)
+
+
 def test_psf_map_containment():
     psf_map = make_test_psfmap(0.15 * u.deg)
     assert_allclose(psf_map.containment(rad=10 * u.deg, energy_true=[10] * u.TeV), 1)
@@ -149,6 +163,106 @@ def test_psfmap_to_psf_kernel():
     assert_allclose(psfkernel.psf_kernel_map.data.sum(axis=(1, 2)), 1.0, atol=1e-7)
 
 
+def test_psfmap_get_psf_kernels():
+    psfmap = make_test_psfmap(0.15 * u.deg)
+
+    energy_axis = psfmap.psf_map.geom.axes[1]
+    kern_geom = WcsGeom.create(binsz=0.02, width=5.0, axes=[energy_axis])
+    positions = SkyCoord([0, 1, -1], [0, 1, 0.5], unit="deg")
+
+    psfkernels = psfmap.get_psf_kernels(
+        positions=positions, geom=kern_geom, max_radius=1 * u.deg
+    )
+    assert len(psfkernels) == 3
+
+    for position, psfkernel in zip(positions, psfkernels):
+        expected = psfmap.get_psf_kernel(
+            position=position, geom=kern_geom, max_radius=1 * u.deg
+        )
+        assert psfkernel.psf_kernel_map.geom == expected.psf_kernel_map.geom
+        assert_allclose(
+            psfkernel.psf_kernel_map.data, expected.psf_kernel_map.data, atol=1e-12
+        )
+
+    psfkernels = psfmap.get_psf_kernels(positions=positions, geom=kern_geom)
+    assert_allclose(psfkernels[0].psf_kernel_map.geom.width, 1.14 * u.deg)
+    assert_allclose(psfkernels[2].psf_kernel_map.data.sum(axis=(1, 2)), 1.0)
+
+
+def test_psfmap_get_psf_kernel_float32():
+    psfmap = make_test_psfmap(0.15 * u.deg)
+
+    energy_axis = psfmap.psf_map.geom.axes[1]
+    kern_geom = WcsGeom.create(binsz=0.02, width=5.0, axes=[energy_axis])
+    position = SkyCoord(1, 1, unit="deg")
+    expected = psfmap.get_psf_kernel(position=position, geom=kern_geom)
+
+    psfmap.psf_map.data = psfmap.psf_map.data.astype(np.float32)
+    psfkernel = psfmap.get_psf_kernel(position=position, geom=kern_geom)
+
+    data_interp = psfmap._get_psf_data_interp()
+    assert data_interp.dtype == np.float64
+    assert data_interp.flags["C_CONTIGUOUS"]
+    assert_allclose(
+        psfkernel.psf_kernel_map.data, expected.psf_kernel_map.data, rtol=1e-5
+    )
+
+    psfkernel = psfmap.get_psf_kernel(
+        position=position, geom=kern_geom, dtype="float32"
+    )
+    assert psfkernel.psf_kernel_map.data.dtype == np.float32
+    assert_allclose(
+        psfkernel.psf_kernel_map.data, expected.psf_kernel_map.data, rtol=1e-5
+    )
+
+
+def test_psfmap_get_psf_kernel_data_modified_in_place():
+    psfmap = make_test_psfmap(0.15 * u.deg)
+    psfmap_wide = make_test_psfmap(0.3 * u.deg)
+
+    energy_axis = psfmap.psf_map.geom.axes[1]
+    kern_geom = WcsGeom.create(binsz=0.02, width=5.0, axes=[energy_axis])
+    position = SkyCoord(1, 1, unit="deg")
+    psfkernel = psfmap.get_psf_kernel(position=position, geom=kern_geom)
+
+    psfmap.psf_map.data[...] = psfmap_wide.psf_map.data
+    actual = psfmap.get_psf_kernel(position=position, geom=kern_geom)
+    expected = psfmap_wide.get_psf_kernel(position=position, geom=kern_geom)
+
+    assert actual.psf_kernel_map.geom == expected.psf_kernel_map.geom
+    assert_allclose(actual.psf_kernel_map.data, expected.psf_kernel_map.data)
+    assert actual.psf_kernel_map.geom != psfkernel.psf_kernel_map.geom
+
+
+@pytest.mark.parametrize("dtype", ["float64", "float32"])
+def test_psfmap_interp_by_coord(dtype):
+    rad_axis = MapAxis.from_edges(np.linspace(0, 1, 11), unit="deg", name="rad")
+    energy_axis = MapAxis.from_energy_bounds(
+        "1 TeV", "10 TeV", nbin=3, name="energy_true"
+    )
+    geom = WcsGeom.create(npix=(10, 8), binsz=0.5, axes=[rad_axis, energy_axis])
+
+    data = np.random.RandomState(0).uniform(1, 2, size=geom.data_shape)
+    psf_map = Map.from_geom(geom, data=data.astype(dtype), unit="sr-1")
+    psfmap = PSFMap(psf_map)
+
+    # inside the map, within one node outside and further outside (fallback)
+    pixels = [(4.3, 3.7), (-0.6, 7.8), (9.9, -0.4), (-3, 2.0), (12, 4)]
+
+    for pix in pixels:
+        lon, lat = geom.to_image().pix_to_coord(pix)
+        coords = {
+            "skycoord": SkyCoord(lon, lat, frame=geom.frame),
+            "energy_true": [[1.5], [3], [7.9]] * u.TeV,
+            "rad": [[[0.02]], [[0.33]], [[0.97]], [[1.02]]] * u.deg,
+        }
+        actual = psfmap._interp_by_coord(coords)
+        expected = psf_map.interp_by_coord(coords)
+
+        assert actual.shape == (4, 3, 1)
+        assert_allclose(actual, expected, rtol=1e-6)
+
+
 def test_psfmap_to_from_hdulist():
     psfmap = make_test_psfmap(0.15 * u.deg)
     hdulist = psfmap.to_hdulist()
@@ -241,6 +355,22 @@ def test_sample_coord_gauss():
     assert_allclose(np.mean(coords.lat), 0, atol=2e-3)
 
 
+@pytest.mark.parametrize("lat", [-90, -30, 0, 60, 90])
+def test_offset_by(lat):
+    position_angle = np.random.RandomState(0).uniform(0, 360, 100)
+    separation = np.linspace(0.01, 2, 100)
+
+    lon, lat_new = _offset_by(
+        lon=20, lat=lat, position_angle=position_angle, separation=separation
+    )
+
+    expected = SkyCoord(20, lat, unit="deg").directional_offset_by(
+        position_angle * u.deg, separation * u.deg
+    )
+    actual = SkyCoord(lon, lat_new, unit="deg")
+    assert_allclose(actual.separation(expected).deg, 0, atol=1e-10)
+
+
 def make_psf_map_obs(geom, obs):
     exposure_map = make_map_exposure_true_energy(
         geom=geom.squash(axis_name="rad"),
@@ -421,6 +551,35 @@ def test_to_image():
     assert_allclose(psf2D.psf_map.data[0][0][12][12], 7.068315, rtol=1e-2)
 
 
+def test_to_image_stacked():
+    psfmap = make_test_psfmap(0.15 * u.deg)
+    psfmap_wide = make_test_psfmap(0.3 * u.deg)
+
+    psf2D = psfmap.to_image()
+    psf2D_wide = psfmap_wide.to_image()
+
+    # with equal exposures the stacked image is the mean of both images
+    psfmap.stack(psfmap_wide)
+    actual = psfmap.to_image()
+
+    assert_allclose(actual.exposure_map.data, 2 * psf2D.exposure_map.data)
+    assert_allclose(
+        actual.psf_map.data, (psf2D.psf_map.data + psf2D_wide.psf_map.data) / 2
+    )
+    assert_allclose(actual.exposure_map.data[0, 0, 12, 12], 7.2e9, rtol=1e-2)
+
+
+def test_to_image_exposure_modified_in_place():
+    psfmap = make_test_psfmap(0.15 * u.deg)
+    psf2D = psfmap.to_image()
+
+    psfmap.exposure_map.data *= 2
+    actual = psfmap.to_image()
+
+    assert_allclose(actual.exposure_map.data, 2 * psf2D.exposure_map.data)
+    assert_allclose(actual.psf_map.data, psf2D.psf_map.data)
+
+
 def test_psf_map_from_gauss():
     energy_axis = MapAxis.from_nodes(
         [1, 3, 10], name="energy_true", interp="log", unit="TeV"
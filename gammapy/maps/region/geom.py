@@ -399,7 +399,6 @@ class RegionGeom(Geom):
         return wcs_geom
 
     def to_binsz_wcs(self, binsz):
-
         """Change the bin size of the underlying WCS geometry.
 
         Parameters
@@ -812,8 +811,6 @@ class RegionGeom(Geom):
             Axes to plot on.
         """
         if self.region:
-            kwargs_point = kwargs_point or {}
-
             if ax is None:
                 ax = plt.gca()
 
@@ -823,23 +820,9 @@ class RegionGeom(Geom):
                     m = Map.from_geom(geom=wcs_geom.to_image())
                     ax = m.plot(add_cbar=False, vmin=-1, vmax=0)
 
-            kwargs.setdefault("facecolor", "None")
-            kwargs.setdefault("edgecolor", "tab:blue")
-            kwargs_point.setdefault("marker", "*")
-
-            for key, value in kwargs.items():
-                key_point = ARTIST_TO_LINE_PROPERTIES.get(key, None)
-                if key_point:
-                    kwargs_point[key_point] = value
-
-            for region in compound_region_to_regions(self.region):
-                region_pix = region.to_pixel(wcs=ax.wcs)
-
-                if isinstance(region, PointSkyRegion):
-                    artist = region_pix.as_artist(**kwargs_point)
-                else:
-                    artist = region_pix.as_artist(**kwargs)
+            artists = self._to_artists(wcs=ax.wcs, kwargs_point=kwargs_point, **kwargs)
 
+            for artist in artists:
                 if path_effect:
                     artist.add_path_effect(path_effect)
 
@@ -848,3 +831,49 @@ class RegionGeom(Geom):
             return ax
         else:
             logging.info("Region definition required.")
+
+    def _to_artists(self, wcs, kwargs_point=None, **kwargs):
+        """Matplotlib artists of the region in pixel coordinates of the given WCS.
+
+        Point regions are represented by `~matplotlib.lines.Line2D` markers,
+        all other regions by `~matplotlib.patches.Patch` objects.
+
+        Parameters
+        ----------
+        wcs : `~astropy.wcs.WCS`
+            WCS of the axes to plot on.
+        kwargs_point : dict
+            Keyword arguments passed to `~matplotlib.lines.Line2D` for point
+            regions.
+        **kwargs : dict
+            Keyword arguments forwarded to `~regions.PixelRegion.as_artist`
+
+        Returns
+        -------
+        artists : list of `~matplotlib.artist.Artist`
+            Artists, one per region of the compound region.
+        """
+        kwargs_point = kwargs_point or {}
+
+        kwargs.setdefault("facecolor", "None")
+        kwargs.setdefault("edgecolor", "tab:blue")
+        kwargs_point.setdefault("marker", "*")
+
+        for key, value in kwargs.items():
+            key_point = ARTIST_TO_LINE_PROPERTIES.get(key, None)
+            if key_point:
+                kwargs_point[key_point] = value
+
+        artists = []
+
+        for region in compound_region_to_regions(self.region):
+            region_pix = region.to_pixel(wcs=wcs)
+
+            if isinstance(region, PointSkyRegion):
+                artist = region_pix.as_artist(**kwargs_point)
+            else:
+                artist = region_pix.as_artist(**kwargs)
+
+            artists.append(artist)
+
+        return artists
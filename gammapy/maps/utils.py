@@ -90,9 +90,9 @@ def edges_from_lo_hi(edges_lo, edges_hi):
     if np.isscalar(edges_lo.value) and np.isscalar(edges_hi.value):
         return u.Quantity([edges_lo, edges_hi])
 
-    edges = edges_lo.copy()
+    # insert returns a new array, so the input is not modified
     try:
-        edges = edges.insert(len(edges), edges_hi[-1])
+        edges = edges_lo.insert(len(edges_lo), edges_hi[-1])
     except AttributeError:
-        edges = np.insert(edges, len(edges), edges_hi[-1])
+        edges = np.insert(edges_lo, len(edges_lo), edges_hi[-1])
     return edges
@@ -38,27 +38,42 @@ class InverseCDFSampler:
             self.pdf = pdf[self.sortindex]
             self.cdf = np.cumsum(self.pdf)
 
-    def sample_axis(self):
+    def sample_axis(self, choices=None):
         """Sample along a given axis.
 
+        Parameters
+        ----------
+        choices : `~numpy.ndarray`, optional
+            Uniform random numbers in [0, 1), one per row of the CDF. If None,
+            they are drawn from ``random_state``. Default is None.
+
         Returns
         -------
         index : tuple of `~numpy.ndarray`
             Coordinates of the drawn sample.
         """
-        choices = self.random_state.uniform(high=1, size=len(self.cdf))
+        if choices is None:
+            choices = self.random_state.uniform(high=1, size=len(self.cdf))
         shape_cdf = self.cdf.shape
 
         cdf_all = np.insert(self.cdf, 0, 0, axis=1)
         edges = np.arange(shape_cdf[1] + 1) - 0.5
 
-        pix_coords = []
+        # linear interpolation of the inverse cdf, evaluated for all rows at once
+        idx = np.sum(cdf_all <= choices[:, np.newaxis], axis=1) - 1
+        idx = np.clip(idx, 0, shape_cdf[1] - 1)
+
+        rows = np.arange(shape_cdf[0])
+        cdf_lo, cdf_hi = cdf_all[rows, idx], cdf_all[rows, idx + 1]
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            slope = (edges[idx + 1] - edges[idx]) / (cdf_hi - cdf_lo)
+            pix_coords = slope * (choices - cdf_lo) + edges[idx]
 
-        for cdf, choice in zip(cdf_all, choices):
-            pix = np.interp(choice, cdf, edges)
-            pix_coords.append(pix)
+        pix_coords = np.where(choices < cdf_all[:, -1], pix_coords, edges[-1])
 
-        return np.array(pix_coords)
+        # rows with a vanishing pdf have an undefined cdf and no valid sample
+        return np.where(np.isfinite(cdf_all[:, -1]), pix_coords, np.nan)
 
     def sample(self, size):
         """Draw sample from the given PDF.
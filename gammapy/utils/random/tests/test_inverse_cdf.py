@@ -62,3 +62,20 @@ def test_axis_sampling():
     x_sampled = np.interp(idx, np.arange(n_sampled), x)
 
     assert_allclose(x_sampled, [0.012266, 0.43081], rtol=1e-4)
+
+
+def test_axis_sampling_zero_bins():
+    pdf = np.array([[0, 0, 0, 0], [1, 0, 0, 1], [0, 2, 0, 1], [0, 0, 0, 3]])
+
+    with np.errstate(invalid="ignore"):
+        sampler = InverseCDFSampler(pdf.astype(float), random_state=0, axis=1)
+
+    edges = np.arange(5) - 0.5
+    cdf_all = np.insert(sampler.cdf, 0, 0, axis=1)
+
+    for choices in [[0.417, 0.72, 1.1e-4, 0.302], [0, 0.5, 2 / 3, 0.999]]:
+        idx = sampler.sample_axis(choices=np.array(choices))
+        expected = [np.interp(c, cdf, edges) for c, cdf in zip(choices, cdf_all)]
+
+        assert np.isnan(idx[0])
+        assert_allclose(idx, expected)
@@ -23,7 +23,7 @@ from gammapy.visualization import (
 )
 def test_plot_spectrum_datasets_off_regions():
     from gammapy.datasets import SpectrumDatasetOnOff
-    from gammapy.maps import Map, RegionNDMap
+    from gammapy.maps import Map, RegionGeom, RegionNDMap
 
     counts_off_1 = RegionNDMap.create("icrs;circle(0, 0.5, 0.2);circle(0.5, 0, 0.2)")
 
@@ -34,23 +34,58 @@ def test_plot_spectrum_datasets_off_regions():
     m = Map.from_geom(geom=counts_off_1.geom.to_wcs_geom())
     ax = m.plot()
 
-    dataset_1 = SpectrumDatasetOnOff(counts_off=counts_off_1)
+    dataset_1 = SpectrumDatasetOnOff(counts_off=counts_off_1, name="dataset_1")
 
-    dataset_2 = SpectrumDatasetOnOff(counts_off=counts_off_2)
+    dataset_2 = SpectrumDatasetOnOff(counts_off=counts_off_2, name="dataset_2")
 
-    dataset_3 = SpectrumDatasetOnOff(counts_off=counts_off_3)
+    dataset_3 = SpectrumDatasetOnOff(counts_off=counts_off_3, name="dataset_3")
 
     plot_spectrum_datasets_off_regions(
         ax=ax, datasets=[dataset_1, dataset_2, dataset_3]
     )
 
-    actual = ax.patches[0].get_edgecolor()
-    assert_allclose(actual, (0.121569, 0.466667, 0.705882, 1.0), rtol=1e-2)
-
-    actual = ax.patches[2].get_edgecolor()
-    assert_allclose(actual, (1.0, 0.498039, 0.054902, 1.0), rtol=1e-2)
+    actual = ax.collections[0].get_edgecolor()
+    assert_allclose(actual[0], (0.121569, 0.466667, 0.705882, 1.0), rtol=1e-2)
+    assert_allclose(actual[2], (1.0, 0.498039, 0.054902, 1.0), rtol=1e-2)
     assert ax.lines[0].get_color() in ["green", "C0"]
 
+    # upper right corner
+    assert ax.get_legend()._loc == 1
+
+    # entries of the previous legend are kept
+    plot_spectrum_datasets_off_regions(ax=ax, datasets=[dataset_1], legend=True)
+    labels = [text.get_text() for text in ax.get_legend().texts]
+    assert labels == ["dataset_1", "dataset_2", "dataset_3", "dataset_1"]
+
+    # style properties are applied to the collection
+    plot_spectrum_datasets_off_regions(
+        ax=ax, datasets=[dataset_1], legend=False, zorder=7, alpha=0.3, hatch="//"
+    )
+    collection = ax.collections[-1]
+    assert collection.get_zorder() == 7
+    assert collection.get_alpha() == 0.3
+    assert collection.get_hatch() == "//"
+
+    # properties varied by the prop_cycle are kept for each patch
+    n_patches = len(ax.patches)
+    plot_spectrum_datasets_off_regions(
+        ax=ax,
+        datasets=[dataset_1, dataset_2],
+        legend=False,
+        prop_cycle=plt.cycler(color=list("rg"), alpha=[0.2, 0.4]),
+    )
+    patches = ax.patches[n_patches:]
+    assert len(patches) == 4
+    assert patches[0].get_alpha() == 0.2
+    assert patches[2].get_alpha() == 0.4
+
+    # datasets without off regions are skipped
+    counts_off_4 = RegionNDMap.from_geom(RegionGeom(region=None))
+    dataset_4 = SpectrumDatasetOnOff(counts_off=counts_off_4, name="dataset_4")
+    plot_spectrum_datasets_off_regions(ax=ax, datasets=[dataset_4], legend=True)
+    labels = [text.get_text() for text in ax.get_legend().texts]
+    assert len(labels) == 4
+
 
 def test_map_panel_plotter():
     t = np.linspace(0.0, 6.1, 10)
@@ -62,11 +97,35 @@ def test_map_panel_plotter():
     with mpl_plot_check():
         plot_contour_line(ax, x, y)
 
+    # the interpolated curve follows the circle
+    xs, ys = ax.lines[0].get_data()
+    assert len(xs) == 50
+    assert_allclose(np.hypot(xs, ys), 1, rtol=1e-2)
+
     x = np.append(x, x[0])
     y = np.append(y, y[0])
     with mpl_plot_check():
         plot_contour_line(ax, x, y)
 
+    # many contours drawn as one collection, without markers
+    from matplotlib.collections import LineCollection
+
+    fig = plt.figure()
+    ax = fig.add_subplot(1, 1, 1)
+    collection = ax.add_collection(LineCollection([]))
+    with mpl_plot_check():
+        plot_contour_line(ax, x, y, collection=collection, marker=None)
+        plot_contour_line(ax, 2 * x, 2 * y, collection=collection, marker=None)
+
+    assert len(ax.lines) == 0
+    segments = collection.get_segments()
+    assert len(segments) == 2
+    assert_allclose(np.hypot(*segments[1].T), 2, rtol=1e-2)
+    assert_allclose(ax.get_xlim(), [-2.2, 2.2], rtol=1e-2)
+
+    with pytest.raises(ValueError):
+        plot_contour_line(ax, x, y, collection=collection, lw=2)
+
 
 def test_plot_theta2_distribution():
     table = Table()
@@ -1,5 +1,7 @@
+import copy
+from functools import lru_cache
 import numpy as np
-from scipy.interpolate import CubicSpline
+from scipy.interpolate import splev, splprep
 from gammapy.maps.axes import UNIT_STRING_FORMAT
 from astropy.visualization import make_lupton_rgb
 import matplotlib.pyplot as plt
@@ -22,6 +24,25 @@ ARTIST_TO_LINE_PROPERTIES = {
     "lw": "markerwidth",
 }
 
+# patch properties that are copied per patch by PatchCollection(match_original=True)
+PATCH_COLLECTION_MATCHED_PROPERTIES = {
+    "aa",
+    "antialiased",
+    "color",
+    "ec",
+    "edgecolor",
+    "facecolor",
+    "fc",
+    "fill",
+    "linestyle",
+    "linewidth",
+    "ls",
+    "lw",
+}
+
+# normalised arc length at which the smooth contour curves are evaluated
+_TS_UNIT = np.linspace(0.0, 1.0, 50)
+
 
 def plot_map_rgb(map_, ax=None, **kwargs):
     """
@@ -64,11 +85,17 @@ def plot_map_rgb(map_, ax=None, **kwargs):
             "One non-spatial axis with exactly 3 bins is needed to plot an RGB image"
         )
 
-    data = [data_slice / np.nanmax(data_slice.flatten()) for data_slice in map_.data]
+    # single precision is sufficient for the 8 bit RGB image
+    data = map_.data.astype(np.float32, copy=False)
+
+    # normalise each of the three slices to its maximum, reducing over
+    # the flattened slices is faster than over two axes
+    max_values = np.nanmax(data.reshape(3, -1), axis=1)
+    data = data / max_values[:, np.newaxis, np.newaxis]
     data = make_lupton_rgb(*data, **kwargs)
 
     ax = map_._plot_default_axes(ax=ax)
-    ax.imshow(data)
+    ax.imshow(data, interpolation="nearest", origin="lower")
 
     if geom.is_allsky:
         ax = map_._plot_format_allsky(ax)
@@ -97,10 +124,14 @@ def plot_spectrum_datasets_off_regions(
         ``len(datasets) <= 10``.
     legend_kwargs : dict
         Keyword arguments used in `matplotlib.axes.Axes.legend`. The ``handler_map`` cannot be
-        overridden.
+        overridden. The legend is placed in the upper right corner by default, pass
+        ``loc="best"`` for the (slow) automatic placement.
     **kwargs : dict
         Keyword arguments used in `gammapy.maps.RegionNDMap.plot_region`. Can contain a
-        `~cycler.Cycler` in a ``prop_cycle`` argument.
+        `~cycler.Cycler` in a ``prop_cycle`` argument. The extended off regions of all
+        datasets are drawn as a single `~matplotlib.collections.PatchCollection`,
+        unless the ``prop_cycle`` varies properties other than colors, line widths
+        and line styles.
 
     Notes
     -----
@@ -133,39 +164,89 @@ def plot_spectrum_datasets_off_regions(
         plot_spectrum_datasets_off_regions(datasets2, ax, legend=True, legend_kwargs=dict(ncol=2))
         plot_spectrum_datasets_off_regions(datasets3, ax, legend=False, edgecolor='magenta')
     """
+    from matplotlib.collections import PatchCollection
     from matplotlib.legend_handler import HandlerPatch, HandlerTuple
     from matplotlib.patches import CirclePolygon, Patch
 
     if ax is None:
         ax = plt.subplot(projection=datasets[0].counts_off.geom.wcs)
 
+    # datasets without off regions have nothing to draw and no legend entry
+    datasets = [
+        dataset
+        for dataset in datasets
+        if getattr(dataset.counts_off.geom, "region", None) is not None
+    ]
+
+    if not datasets:
+        return ax
+
     legend = legend or legend is None and len(datasets) <= 10
     legend_kwargs = legend_kwargs or {}
     handles, labels = [], []
 
     prop_cycle = kwargs.pop("prop_cycle", plt.rcParams["axes.prop_cycle"])
 
+    # the legend proxies are copied from a prototype, which is cheaper than
+    # initialising a new patch for every dataset
+    patch_proto = Patch()
+    patches = []
+
     for props, dataset in zip(prop_cycle(), datasets):
         plot_kwargs = kwargs.copy()
         plot_kwargs["facecolor"] = "None"
         plot_kwargs.setdefault("edgecolor")
         plot_kwargs.update(props)
 
-        dataset.counts_off.plot_region(ax, **plot_kwargs)
+        geom = dataset.counts_off.geom
+
+        for artist in geom._to_artists(wcs=ax.wcs, **plot_kwargs):
+            if isinstance(artist, Patch):
+                patches.append(artist)
+            else:
+                ax.add_artist(artist)
 
         # create proxy artist for the custom legend
         if legend:
-            handle = Patch(**plot_kwargs)
+            handle = copy.copy(patch_proto)
+            handle.update(plot_kwargs)
             handles.append(handle)
             labels.append(dataset.name)
 
+    # a single collection is much faster to draw than many individual patches,
+    # the properties not matched per patch are the same for all of them
+    if set(prop_cycle.keys) - PATCH_COLLECTION_MATCHED_PROPERTIES:
+        for patch in patches:
+            ax.add_artist(patch)
+    elif patches:
+        style = {
+            key: value
+            for key, value in kwargs.items()
+            if key not in PATCH_COLLECTION_MATCHED_PROPERTIES
+        }
+        collection = PatchCollection(patches, match_original=True, **style)
+        ax.add_collection(collection, autolim=False)
+
     if legend:
         legend = ax.get_legend()
-        if legend:
-            handles = legend.legendHandles + handles
+
+        # the entries of a legend created by a previous call are stored
+        # on the axes, so they don't have to be recovered from the legend
+        cached = getattr(ax, "_off_regions_legend_entries", None)
+
+        if cached is not None and cached[0] is legend:
+            handles = cached[1] + handles
+            labels = cached[2] + labels
+        elif legend:
+            # renamed to legend_handles in matplotlib 3.7
+            legend_handles = getattr(legend, "legend_handles", None)
+            if legend_handles is None:
+                legend_handles = legend.legendHandles
+            handles = legend_handles + handles
             labels = [text.get_text() for text in legend.texts] + labels
 
-        handles = [(handle, handle) for handle in handles]
+        entries = (handles, labels)
+        handles = list(zip(handles, handles))
         tuple_handler = HandlerTuple(ndivide=None, pad=0)
 
         def patch_func(
@@ -177,16 +258,41 @@ def plot_spectrum_datasets_off_regions(
         patch_handler = HandlerPatch(patch_func)
 
         legend_kwargs.setdefault("handletextpad", 0.5)
+        legend_kwargs.setdefault("loc", "upper right")
         legend_kwargs["handler_map"] = {Patch: patch_handler, tuple: tuple_handler}
-        ax.legend(handles, labels, **legend_kwargs)
+        legend = ax.legend(handles, labels, **legend_kwargs)
+        ax._off_regions_legend_entries = (legend,) + entries
 
     return ax
 
 
-def plot_contour_line(ax, x, y, **kwargs):
-    """Plot smooth curve from contour points"""
-    xf = x
-    yf = y
+def _get_contour_line(x, y):
+    """Closed contour points and the smooth curve interpolated through them.
+
+    The result is cached, so repeated plotting of the same contour does not
+    fit the spline again.
+
+    Parameters
+    ----------
+    x, y : `~numpy.ndarray`
+        Coordinates of the contour points.
+
+    Returns
+    -------
+    xf, yf : `~numpy.ndarray`
+        Coordinates of the closed contour points.
+    out : `~numpy.ndarray`
+        Interpolated curve with shape (50, 2).
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    return _get_contour_line_cached(x.tobytes(), y.tobytes())
+
+
+@lru_cache(maxsize=128)
+def _get_contour_line_cached(x_bytes, y_bytes):
+    xf = x = np.frombuffer(x_bytes)
+    yf = y = np.frombuffer(y_bytes)
 
     # close contour
     if not (x[0] == x[-1] and y[0] == y[-1]):
@@ -195,27 +301,67 @@ def plot_contour_line(ax, x, y, **kwargs):
 
     # curve parametrization must be strictly increasing
     # so we use the cumulative distance of each point from the first one
-    dist = np.sqrt(np.diff(xf) ** 2.0 + np.diff(yf) ** 2.0)
-    dist = [0] + list(dist)
-    t = np.cumsum(dist)
-    ts = np.linspace(0, t[-1], 50)
+    dist = np.hypot(np.diff(xf), np.diff(yf))
+    t = np.empty(dist.size + 1)
+    t[0] = 0
+    np.cumsum(dist, out=t[1:])
+    ts = _TS_UNIT * t[-1]
+
+    # the curve is only evaluated at 50 points, so long contours are thinned
+    # out to points at approximately equidistant arc length before the fit
+    if t.size > 200:
+        idx = np.unique(np.searchsorted(t, np.linspace(0, t[-1], 200)))
+        tck, _ = splprep([xf[idx], yf[idx]], u=t[idx], s=0, k=3, per=1)
+    else:
+        tck, _ = splprep([xf, yf], u=t, s=0, k=3, per=1)
+    out = np.column_stack(splev(ts, tck))
+
+    # the cached arrays are shared between calls
+    for array in [xf, yf, out]:
+        array.flags.writeable = False
+
+    return xf, yf, out
 
-    # 1D cubic spline interpolation
-    cs = CubicSpline(t, np.c_[xf, yf], bc_type="periodic")
-    out = cs(ts)
+
+def plot_contour_line(ax, x, y, collection=None, **kwargs):
+    """Plot smooth curve from contour points.
+
+    Parameters
+    ----------
+    ax : `~matplotlib.axes.Axes`
+        Axes object to plot on.
+    x, y : `~numpy.ndarray`
+        Coordinates of the contour points.
+    collection : `~matplotlib.collections.LineCollection`, optional
+        If given, the smooth curve is appended as a segment to this collection
+        instead of being drawn as a separate line. This is faster when many
+        contours are plotted, the style is then set on the collection and the
+        axes limits are updated to include the curve.
+    **kwargs : dict
+        Keyword arguments passed to `~matplotlib.axes.Axes.plot`. The contour
+        points are drawn with ``marker`` (default "+") and ``color`` (default "b"),
+        ``marker=None`` skips them. If ``collection`` is given, no other keyword
+        arguments are allowed.
+    """
+    xf, yf, out = _get_contour_line(x, y)
 
     # plot
-    if "marker" in kwargs.keys():
-        marker = kwargs.pop("marker")
-    else:
-        marker = "+"
-    if "color" in kwargs.keys():
-        color = kwargs.pop("color")
+    marker = kwargs.pop("marker", "+")
+    color = kwargs.pop("color", "b")
+
+    if collection is None:
+        ax.plot(out[:, 0], out[:, 1], "-", color=color, **kwargs)
+    elif kwargs:
+        raise ValueError(
+            f"The style of the contour line is set on the collection, got {list(kwargs)}"
+        )
     else:
-        color = "b"
+        collection.set_segments(collection.get_segments() + [out])
+        ax.update_datalim(out)
+        ax.autoscale_view()
 
-    ax.plot(out[:, 0], out[:, 1], "-", color=color, **kwargs)
-    ax.plot(xf, yf, linestyle="", marker=marker, color=color)
+    if marker is not None:
+        ax.plot(xf, yf, linestyle="", marker=marker, color=color)
 
 
 def plot_theta_squared_table(table):
@@ -242,31 +388,36 @@ def plot_theta_squared_table(table):
 
     x = theta2_axis.center.value
     x_edges = theta2_axis.edges.value
-    xerr = (x - x_edges[:-1], x_edges[1:] - x)
+
+    # the same (2, N) bin width array is shared by all error bars
+    xerr = np.stack([x - x_edges[:-1], x_edges[1:] - x])
+
+    counts = np.asarray(table["counts"])
+    counts_off = np.asarray(table["counts_off"])
 
     ax0.errorbar(
         x,
-        table["counts"],
+        counts,
         xerr=xerr,
-        yerr=np.sqrt(table["counts"]),
+        yerr=np.sqrt(counts),
         linestyle="None",
         label="Counts",
     )
 
     ax0.errorbar(
         x,
-        table["counts_off"],
+        counts_off,
         xerr=xerr,
-        yerr=np.sqrt(table["counts_off"]),
+        yerr=np.sqrt(counts_off),
         linestyle="None",
         label="Counts Off",
     )
 
     ax0.errorbar(
         x,
-        table["excess"],
+        np.asarray(table["excess"]),
         xerr=xerr,
-        yerr=(table["excess_errn"], table["excess_errp"]),
+        yerr=np.stack([table["excess_errn"], table["excess_errp"]]),
         fmt="+",
         linestyle="None",
         label="Excess",
@@ -278,6 +429,6 @@ def plot_theta_squared_table(table):
     ax0.legend()
 
     ax1 = plt.subplot(2, 1, 2)
-    ax1.errorbar(x, table["sqrt_ts"], xerr=xerr, linestyle="None")
+    ax1.errorbar(x, np.asarray(table["sqrt_ts"]), xerr=xerr, linestyle="None")
     ax1.set_xlabel(f"Theta [{theta2_axis.unit.to_string(UNIT_STRING_FORMAT)}]")
     ax1.set_ylabel("Significance")